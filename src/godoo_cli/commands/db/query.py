@@ -1,5 +1,6 @@
 import logging
 from enum import Enum
+from typing import Dict, List, Optional, Tuple
 
 import typer
 from psycopg2 import OperationalError, ProgrammingError
@@ -123,6 +124,28 @@ def _get_installed_modules(db_connection: DBConnection, to_install=False):
         return [r[0] for r in sql_res]
 
 
+def _get_module_states(db_connection: DBConnection, module_names: List[str]) -> Dict[str, Tuple[str, Optional[str]]]:
+    """Get state and installed version of the given modules from ir_module_module
+
+    Parameters
+    ----------
+    db_connection : DBConnection
+        Connection to a bootstrapped Odoo database
+    module_names : List[str]
+        Modules to look up
+
+    Returns
+    -------
+    Dict[str, Tuple[str, Optional[str]]]
+        Module name to (state, latest_version). Modules unknown to the database are missing.
+    """
+    with db_connection.connect() as cursor:
+        cursor.execute(
+            "SELECT name, state, latest_version FROM ir_module_module WHERE name = ANY(%s);", [list(module_names)]
+        )
+        return {name: (state, version) for name, state, version in cursor.fetchall()}
+
+
 @CLI.arg_annotator
 def get_installed_modules(
     db_host=CLI.database.db_host,
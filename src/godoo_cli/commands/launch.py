@@ -1,8 +1,9 @@
 import logging
 import re
+import shlex
 import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import typer
 
@@ -27,8 +28,8 @@ def _launch_command(
     extra_cmd_args: List[str],
     workspace_addon_path: Path,
     upgrade_workspace_modules: bool = True,
-):
-    """Build Odoo Launch command
+) -> List[str]:
+    """Build Odoo Launch command as argv list
 
     Parameters
     ----------
@@ -42,6 +43,11 @@ def _launch_command(
         Path to dev workspace addons folder
     upgrade_workspace_modules : bool, optional
         upgrade workspace addons, by default True
+
+    Returns
+    -------
+    List[str]
+        odoo-bin argv, ready to be run without a shell
     """
     upgrade_addons = (
         [f.name for f in godooModules(workspace_addon_path).get_modules()] if upgrade_workspace_modules else []
@@ -56,7 +62,7 @@ def _launch_command(
         f"-c {str(odoo_conf_path.absolute())}",
     ] + extra_cmd_args
     odoo_cmd = list(filter(None, odoo_cmd))
-    return " ".join(odoo_cmd)
+    return shlex.split(" ".join(odoo_cmd))
 
 
 def bootstrap_and_prep_launch_cmd(
@@ -75,7 +81,7 @@ def bootstrap_and_prep_launch_cmd(
     install_workspace_addons: bool = True,
     launch_or_bootstrap: bool = False,
     languages: str = "de_DE,en_US",
-):
+) -> Union[int, List[str]]:
     """Start Bootstrap if database is not bootstrapped. Install Py Depends And return Launch CMD.
 
     Parameters
@@ -114,8 +120,8 @@ def bootstrap_and_prep_launch_cmd(
 
     Returns
     -------
-    Union[int,str]
-        Int return code of bootstrap if not 0 else launch cmd as string
+    Union[int,List[str]]
+        Int return code of bootstrap if not 0 else launch cmd as argv list
     """
     LOGGER.info("Starting godoo Init Script")
 
@@ -244,7 +250,7 @@ def launch_odoo(
         languages=languages,
     )
 
-    if not isinstance(launch_cmd, str):
+    if not isinstance(launch_cmd, list):
         LOGGER.error("godoo Launch Failed. Bootstrap unsuccessfull. Aborting Launch...")
         return CLI.returner(launch_cmd)
 
@@ -304,11 +310,15 @@ def launch_import(
         multithread_worker_count=multithread_worker_count,
     )
 
-    if not isinstance(launch_cmd, str):
+    if not isinstance(launch_cmd, list):
         LOGGER.error("godoo Launch Failed. Bootstrap unsuccessfull. Aborting Launch...")
         return CLI.returner(launch_cmd)
 
-    launch_cmd = re.sub(r"(--dev [\w,]+)(,reload)", r"\1", launch_cmd)  # Remove reload option from CMD String
+    # Remove reload option from --dev value
+    launch_cmd = [
+        re.sub(r",reload\b", "", arg) if prev_arg == "--dev" else arg
+        for prev_arg, arg in zip([""] + launch_cmd, launch_cmd)
+    ]
 
     LOGGER.info("Starting Data Importer Thread for: '%s'", ", ".join(map(str, load_data_path)))
     loader_thread = threading.Thread(
@@ -1,7 +1,6 @@
 import logging
 
 import typer
-from godoo_rpc.login import wait_for_odoo
 
 from ...cli_common import CommonCLI
 
@@ -20,6 +19,8 @@ def set_config_parameter(
 ):
     """Create/Set/Delete ir.config_parameter in Odoo"""
 
+    from godoo_rpc.login import wait_for_odoo
+
     odoo_api = wait_for_odoo(
         odoo_host=rpc_host,
         odoo_db=rpc_database,
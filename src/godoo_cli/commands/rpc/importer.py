@@ -9,8 +9,6 @@ from pathlib import Path
 from typing import List
 
 import typer
-from godoo_rpc import import_data
-from godoo_rpc.login import wait_for_odoo
 
 from ...cli_common import CommonCLI
 
@@ -49,6 +47,10 @@ def import_to_odoo(
     Import [bold green]csv, xlsx, json, .py [/bold green] files into Odoo.
     Adds an ir.config_parameter containing timestamp of each imported file.
     """
+    # godoo_rpc pulls in pandas. Import on use to keep it out of CLI startup.
+    from godoo_rpc import import_data
+    from godoo_rpc.login import wait_for_odoo
+
     odoo_api = wait_for_odoo(
         odoo_host=rpc_host,
         odoo_db=rpc_database,
@@ -1,17 +1,18 @@
 import logging
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
 import typer
-from godoo_rpc import OdooApiWrapper
-from godoo_rpc.login import wait_for_odoo
 
 from ...cli_common import CommonCLI
 
+if TYPE_CHECKING:
+    from godoo_rpc import OdooApiWrapper
+
 CLI = CommonCLI()
 LOGGER = logging.getLogger(__name__)
 
 
-def rpc_get_modules(odoo_api: OdooApiWrapper, module_query: str, valid_module_names: List[str] = None):
+def rpc_get_modules(odoo_api: "OdooApiWrapper", module_query: str, valid_module_names: List[str] = None):
     """Get ir.module.module records by a query search string.
 
     Parameters
@@ -95,6 +96,8 @@ def install_modules(
 ):
     """Install or upgrade Odoo modules via RPC. Can act on multiple modules with % wildcard"""
 
+    from godoo_rpc.login import wait_for_odoo
+
     odoo_api = wait_for_odoo(
         odoo_host=rpc_host,
         odoo_db=rpc_database,
@@ -124,6 +127,8 @@ def uninstall_modules(
 ):
     """Uninstall odoo Modules via RPC. Can act on multiple modules with % wildcard"""
 
+    from godoo_rpc.login import wait_for_odoo
+
     odoo_api = wait_for_odoo(
         odoo_host=rpc_host,
         odoo_db=rpc_database,
@@ -3,7 +3,6 @@ from base64 import b64decode
 from pathlib import Path
 
 import typer
-from godoo_rpc.login import wait_for_odoo
 
 from ...cli_common import CommonCLI
 from ...helpers.modules import godooModule, godooModules
@@ -109,6 +108,8 @@ def dump_translations(
     module_names = [m.name for m in godoo_modules]
     LOGGER.debug("Found modules: %s", module_names)
 
+    from godoo_rpc.login import wait_for_odoo
+
     odoo_api = wait_for_odoo(
         odoo_host=rpc_host,
         odoo_db=rpc_database,
@@ -1,19 +1,22 @@
 """Commands to clone Odoo and addon source code"""
 
+import concurrent.futures
 import configparser
 import logging
+import os
+import re
 import shutil
-import tempfile
+import zipfile
+from collections import defaultdict
 from enum import Enum
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 import typer
-from ruamel.yaml import YAML
 
 from ..cli_common import CommonCLI
-from ..git import GitUrl, git_ensure_addon_repos, git_ensure_odoo_repo
-from ..helpers.modules import get_addon_paths, get_zip_addon_path, godooModules
+from ..git import get_git_url, git_ensure_addon_repos, git_ensure_odoo_repo
+from ..helpers.modules import get_addon_paths, get_module_registry, get_zip_addon_path, godooModules
 from ..helpers.modules_py import _install_py_reqs_for_modules
 from ..helpers.odoo_manifest import remove_unused_folders
 from ..helpers.system import download_file
@@ -22,6 +25,8 @@ from .db.query import _get_installed_modules
 
 LOGGER = logging.getLogger(__name__)
 CLI = CommonCLI()
+ODOO_CONF_SECTION_RE = re.compile(r"^\[([^\]]+)\][ \t]*$", re.MULTILINE)
+ADDONS_PATH_LINE_RE = re.compile(r"^(addons_path[ \t]*[=:])[ \t]*(.*)$", re.MULTILINE)
 
 
 class UpdateMode(str, Enum):
@@ -31,12 +36,148 @@ class UpdateMode(str, Enum):
     thirdparty = "thirdparty"
 
 
+ZIP_UPDATE_MODES = frozenset({UpdateMode.all, UpdateMode.zip})
+ODOO_UPDATE_MODES = frozenset({UpdateMode.all, UpdateMode.odoo})
+THIRDPARTY_UPDATE_MODES = frozenset({UpdateMode.all, UpdateMode.thirdparty})
+
+ZIP_COPY_BUFSIZE = 1 << 20
+
+
+def _zip_module_roots(member_names: List[str]) -> Dict[str, str]:
+    """Find Odoo modules in a zip by its member names.
+    We can have zip files with one or more modules.
+    Either the first folder contains multiple or its a module by itself.
+
+    Parameters
+    ----------
+    member_names : List[str]
+        zip member names as returned by ZipFile.namelist()
+
+    Returns
+    -------
+    Dict[str, str]
+        {member_prefix: module_name} of modules in the zip root or one level down
+
+    Raises
+    ------
+    IndexError
+        If a module name is found multiple times in the zip
+    """
+    module_roots = {}
+    for name in member_names:
+        parts = name.split("/")
+        if parts[-1] != "__manifest__.py" or len(parts) not in (2, 3):
+            continue
+        module_name = parts[-2]
+        prefix = "/".join(parts[:-1]) + "/"
+        if module_name in module_roots.values() and prefix not in module_roots:
+            raise IndexError(f"Module {module_name} is found in multiple paths of zip file")
+        module_roots[prefix] = module_name
+    return module_roots
+
+
+def _extract_zip_modules(zf: zipfile.ZipFile, module_targets: Dict[str, Path]):
+    """Extract only the module subtrees of zf directly into their target folders using a large copy buffer.
+
+    Parameters
+    ----------
+    zf : zipfile.ZipFile
+        Opened zip file
+    module_targets : Dict[str, Path]
+        {member_prefix: target_folder} of module roots in the zip
+
+    Raises
+    ------
+    ValueError
+        If a member would be extracted outside of its target folder
+    """
+    for info in zf.infolist():
+        parts = info.filename.split("/", 2)
+        for depth in (1, 2):
+            prefix = "/".join(parts[:depth]) + "/"
+            if target_folder := module_targets.get(prefix):
+                break
+        else:
+            continue
+        member_path = os.path.normpath(info.filename[len(prefix) :] or ".")
+        if os.path.isabs(member_path) or member_path.split(os.sep, 1)[0] == "..":
+            raise ValueError(f"Refusing to extract zip member outside target folder: {info.filename}")
+        dest = target_folder / member_path
+        if info.is_dir():
+            dest.mkdir(parents=True, exist_ok=True)
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with zf.open(info) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, ZIP_COPY_BUFSIZE)
+
+
+def _archive_target_folder_name(zip_file: Path, module_roots: Dict[str, str]) -> str:
+    """Folder name below the addon folder that the modules of zip_file get extracted into."""
+    return "single_mods" if len(module_roots) == 1 else zip_file.stem
+
+
+def _unpack_addon_archive_group(zip_files: List[Path], target_addon_folder: Path) -> bool:
+    """Extract archives that share a target folder one after another, so the last one wins.
+
+    Parameters
+    ----------
+    zip_files : List[Path]
+        zip files to extract, in order
+    target_addon_folder : Path
+        where to place the modules
+
+    Returns
+    -------
+    bool
+        True if a new addon folder was created
+    """
+    results = [_unpack_addon_archive(zip_file, target_addon_folder) for zip_file in zip_files]
+    return any(results)
+
+
+def _unpack_addon_archive(zip_file: Path, target_addon_folder: Path) -> bool:
+    """Extract the modules of one addon archive into target_addon_folder.
+
+    Parameters
+    ----------
+    zip_file : Path
+        zip file to extract
+    target_addon_folder : Path
+        where to place the modules
+
+    Returns
+    -------
+    bool
+        True if a new addon folder was created
+    """
+    with zipfile.ZipFile(zip_file) as zf:
+        # Only reads the central directory. Modules are found without decompressing anything.
+        module_roots = _zip_module_roots(zf.namelist())
+        if not module_roots:
+            LOGGER.warning("Could not find valid modules in thirdparty zip: %s", zip_file)
+            return False
+        LOGGER.info("Extracting addon archive: %s", zip_file)
+        LOGGER.debug("Found modules in Zipfile:\n%s", [p.rstrip("/") for p in module_roots])
+        target_folder = target_addon_folder / _archive_target_folder_name(zip_file, module_roots)
+        is_new_folder = not target_folder.exists()
+        target_folder.mkdir(exist_ok=True)
+        module_targets = {}
+        for prefix, module_name in module_roots.items():
+            module_target = target_folder / module_name
+            if os.path.lexists(module_target):
+                shutil.rmtree(module_target, ignore_errors=True)
+            module_targets[prefix] = module_target
+        _extract_zip_modules(zf, module_targets)
+    return is_new_folder
+
+
 def unpack_addon_archives(
     archive_folder: Path,
     target_addon_folder: Path,
     remove_excess: bool = False,
-):
+) -> bool:
     """Take archive files from archive_folder and extract them into target_addon_folder.
+    Archives with different target folders are extracted in parallel, as zlib releases the GIL while decompressing.
 
     Parameters
     ----------
@@ -46,36 +187,66 @@ def unpack_addon_archives(
         where to place them
     remove_excess : bool , optional
         remove all and then unzip, by default False
+
+    Returns
+    -------
+    bool
+        True if addon folders were added or removed
     """
     target_addon_folder.mkdir(exist_ok=True, parents=True)
+    folders_changed = False
     if remove_excess:
         LOGGER.debug("Clearing out unarchive folder: %s", target_addon_folder)
-        for folder in target_addon_folder.iterdir():
-            shutil.rmtree(folder)
+        old_folders = list(target_addon_folder.iterdir())
+        folders_changed = bool(old_folders)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            list(executor.map(shutil.rmtree, old_folders))
     LOGGER.info("Extracting archive addons to: %s", target_addon_folder)
-    for zip_file in archive_folder.glob("*.zip"):
-        LOGGER.info("Extracting addon archive: %s", zip_file)
-        with tempfile.TemporaryDirectory() as td:
-            td = Path(td)
-            shutil.unpack_archive(zip_file, td)
-            # We can have zip files with one or more modules.
-            # Either the first folder contains multiple or its a module by itself
-            # So first get the real modules form the zip root or one level down and then move them to subpaths
-            possible_paths = [td] + list(td.glob("*/"))
-            zip_modules = list(godooModules(possible_paths).get_modules())
-            if not zip_modules:
-                LOGGER.warning("Could not find valid modules in thirdparty zip: %s", zip_file)
-                continue
-            LOGGER.debug(
-                "Found modules in Zipfile:\n%s",
-                [str(f.path.relative_to(td)) for f in zip_modules],
-            )
-            target_folder = target_addon_folder / ("single_mods" if len(zip_modules) == 1 else zip_file.stem)
-            target_folder.mkdir(exist_ok=True)
-            for m in zip_modules:
-                module_target = target_folder / m.name
-                shutil.rmtree(module_target, ignore_errors=True)
-                shutil.move(m.path, module_target)
+    zip_files = list(archive_folder.glob("*.zip"))
+    if not zip_files:
+        return folders_changed
+    # Archives sharing a target folder (e.g. all single module zips) must not interleave their rmtree and extract
+    archive_groups = defaultdict(list)
+    for zip_file in zip_files:
+        with zipfile.ZipFile(zip_file) as zf:
+            module_roots = _zip_module_roots(zf.namelist())
+        archive_groups[_archive_target_folder_name(zip_file, module_roots)].append(zip_file)
+    with concurrent.futures.ThreadPoolExecutor(min(8, len(archive_groups), os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(_unpack_addon_archive_group, group, target_addon_folder)
+            for group in archive_groups.values()
+        ]
+        results = [future.result() for future in futures]
+    return folders_changed or any(results)
+
+
+def _options_addons_path_line(conf_text: str) -> Optional[re.Match]:
+    """Find the addons_path line in the [options] section of odoo.conf text.
+
+    Parameters
+    ----------
+    conf_text : str
+        odoo.conf contents
+
+    Returns
+    -------
+    Optional[re.Match]
+        ADDONS_PATH_LINE_RE match with positions in conf_text.
+        None if there is no such line or its value continues on the next line.
+    """
+    sections = list(ODOO_CONF_SECTION_RE.finditer(conf_text))
+    for index, section in enumerate(sections):
+        if section.group(1).strip() != "options":
+            continue
+        section_end = sections[index + 1].start() if index + 1 < len(sections) else len(conf_text)
+        line_match = ADDONS_PATH_LINE_RE.search(conf_text, section.end(), section_end)
+        if not line_match:
+            return None
+        next_line = conf_text[line_match.end() + 1 : section_end].partition("\n")[0]
+        if next_line[:1] in (" ", "\t") and next_line.strip():
+            return None  # Multi line value. Leave that to configparser.
+        return line_match
+    return None
 
 
 def update_odoo_conf_addon_paths(odoo_conf: Path, addon_paths: List[Path]):
@@ -88,15 +259,34 @@ def update_odoo_conf_addon_paths(odoo_conf: Path, addon_paths: List[Path]):
     addon_paths : List[Path]
         list of paths
     """
-    if not odoo_conf.exists():
-        raise FileNotFoundError("Odoo.conf not found at: %s" % odoo_conf)
+    try:
+        conf_text = odoo_conf.read_text()
+    except FileNotFoundError:
+        raise FileNotFoundError("Odoo.conf not found at: %s" % odoo_conf) from None
+    cwd = os.getcwd()  # Resolve once instead of calling Path.absolute() per path
+    addon_paths = ",".join([os.fspath(p) if p.is_absolute() else os.path.join(cwd, os.fspath(p)) for p in addon_paths])
+
+    # Fast path: Rewrite only the addons_path line instead of re-serializing the whole config.
+    if line_match := _options_addons_path_line(conf_text):
+        if line_match.group(2).strip() == addon_paths:
+            LOGGER.debug("Addon Paths in Odoo Config are up to date.")
+            return
+        LOGGER.info("Writing Addon Paths to Odoo Config.")
+        LOGGER.debug(addon_paths)
+        start, end = line_match.span()
+        odoo_conf.write_text(f"{conf_text[:start]}{line_match.group(1)} {addon_paths}{conf_text[end:]}")
+        return
+
     config = configparser.ConfigParser()
-    config.read(odoo_conf)
-    addon_paths = ",".join([str(p.absolute()) for p in addon_paths])
+    config.read_string(conf_text, source=str(odoo_conf))
+    if config["options"].get("addons_path") == addon_paths:
+        LOGGER.debug("Addon Paths in Odoo Config are up to date.")
+        return
     config["options"]["addons_path"] = addon_paths
     LOGGER.info("Writing Addon Paths to Odoo Config.")
     LOGGER.debug(addon_paths)
-    config.write(odoo_conf.open("w"))
+    with odoo_conf.open("w") as f:
+        config.write(f)
 
 
 @CLI.unpacker
@@ -124,7 +314,6 @@ def py_depends_by_db(
         workspace_addon_path=workspace_addon_path,
         thirdparty_addon_path=thirdparty_addon_path,
     )
-    module_list = [m for m in module_list]
     module_reg = godooModules(odoo_addon_paths)
     modules = list(module_reg.get_modules(module_list, raise_missing_names=False))
     _install_py_reqs_for_modules(modules, module_reg)
@@ -152,7 +341,6 @@ def get_installed_module_paths(
         workspace_addon_path=workspace_addon_path,
         thirdparty_addon_path=thirdparty_addon_path,
     )
-    module_list = [m for m in module_list]
     modules = godooModules(odoo_addon_paths).get_modules(module_list)
     for m in modules:
         print(m.path.absolute())  # pylint: disable=print-used
@@ -175,14 +363,42 @@ def py_depends_by_modules(
         workspace_addon_path=workspace_addon_path,
         thirdparty_addon_path=thirdparty_addon_path,
     )
+    module_reg = get_module_registry(odoo_addon_paths)
 
     if len(module_list) == 1 and module_list[0] == "all":
         module_list = []
-    module_reg = godooModules(odoo_addon_paths)
     modules = module_reg.get_modules(module_list)
     _install_py_reqs_for_modules(modules, module_reg)
 
 
+def _manifest_file_url(manifest_path: Path, file_path: str) -> str:
+    """Get raw file URL for file_path in the odoo repo specified in manifest.
+
+    Parameters
+    ----------
+    manifest_path : Path
+        godoo manifest path
+    file_path : str
+        Relative Filepath in Repository
+
+    Returns
+    -------
+    str
+        URL Pointing to the Raw file contents on the Remote
+    """
+    from ruamel.yaml import YAML  # Keeps ruamel out of CLI startup.
+
+    # Read only, so skip the comment preserving roundtrip loader. "safe" uses the libyaml based parser if available.
+    manifest = YAML(typ="safe").load(manifest_path)
+    odoo_spec = manifest["odoo"]
+    file_ref = odoo_spec.get("commit") or odoo_spec.get("branch")
+    if not file_ref:
+        raise ValueError(
+            "Need to provide file ref. If you provided a manifest, make sure there is a branch or commit key in the odoo section"
+        )
+    return get_git_url(odoo_spec["url"]).get_file_raw_url(ref=file_ref, file_path=file_path)
+
+
 @CLI.unpacker
 @CLI.arg_annotator
 def get_source_file(
@@ -197,15 +413,13 @@ def get_source_file(
     if not repo_url and not manifest_path:
         raise ValueError("Need to provide either manifest_yml or repo_url")
     if manifest_path and not repo_url:
-        manifest = YAML().load(manifest_path.resolve())
-        odoo_spec = manifest["odoo"]
-        repo_url = odoo_spec["url"]
-        file_ref = odoo_spec.get("commit") or odoo_spec.get("branch")
+        file_url = _manifest_file_url(manifest_path=manifest_path, file_path=file_path)
+        return download_file(url=file_url, save_path=save_path)
     if not file_ref:
         raise ValueError(
             "Need to provide file ref. If you provided a manifest, make sure there is a branch or commit key in the odoo section"
         )
-    git_url = GitUrl(repo_url)
+    git_url = get_git_url(repo_url)
     file_url = git_url.get_file_raw_url(ref=file_ref, file_path=file_path)
 
     return download_file(url=file_url, save_path=save_path)
@@ -235,15 +449,26 @@ def get_source(
         "--force-fetch",
         help="Forces origin fetch, regardless of current branch or commit sha (may be slow)",
     ),
+    clone_workers: int = typer.Option(
+        0,
+        min=0,
+        envvar="GODOO_CLONE_PARALLELISM",
+        help="How many thirdparty repos to clone in parallel. 0 for twice the CPU count (min 8, max 16)",
+    ),
 ):
     """Download/Unzip Odoo Source and thirdparty addons."""
     LOGGER.info("Updating Source Repos")
     zip_addon_path = get_zip_addon_path(thirdparty_addon_path)
+    # In zip only mode, addon paths only change when unpacking adds or removes addon folders
+    sync_conf = update_mode != UpdateMode.zip
 
-    if update_mode in ["all", "zip"]:
-        unpack_addon_archives(thirdparty_zip_source, zip_addon_path, remove_excess=remove_unspecified_addons)
+    if update_mode in ZIP_UPDATE_MODES:
+        zip_folders_changed = unpack_addon_archives(
+            thirdparty_zip_source, zip_addon_path, remove_excess=remove_unspecified_addons
+        )
+        sync_conf = sync_conf or zip_folders_changed
 
-    if update_mode in ["all", "odoo"]:
+    if update_mode in ODOO_UPDATE_MODES:
         git_ensure_odoo_repo(
             target_folder=odoo_main_path,
             manifest_file=manifest_path,
@@ -252,12 +477,13 @@ def get_source(
             download_archive=download_zipmode,
         )
 
-    if update_mode in ["all", "thirdparty"]:
+    if update_mode in THIRDPARTY_UPDATE_MODES:
         git_repos = git_ensure_addon_repos(
             root_folder=thirdparty_addon_path,
             git_yml_path=manifest_path,
             generate_yml_compare_comments=add_compare_comments,
             download_archive=download_zipmode,
+            clone_workers=clone_workers,
         )
         if remove_unspecified_addons:
             remove_unused_folders(
@@ -266,7 +492,8 @@ def get_source(
                 keep_folders=[zip_addon_path],
             )
 
-    if (conf_path := odoo_conf_path).exists():
+    if sync_conf and (conf_path := odoo_conf_path).exists():
+        get_addon_paths.cache_clear()  # Source folders might have changed above
         odoo_addon_paths = get_addon_paths(
             odoo_main_repo=odoo_main_path,
             workspace_addon_path=workspace_addon_path,
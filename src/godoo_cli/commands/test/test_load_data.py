@@ -1,12 +1,15 @@
 import logging
+import os
 from typing import List
 
 import typer
 
 from ...cli_common import CommonCLI
-from ...helpers.modules import get_addon_paths, godooModules
+from ...helpers.modules import get_addon_paths, get_module_registry, godooModule
+from ...helpers.odoo_files import odoo_bin_get_version
 from ...helpers.system import run_cmd
 from ..db.connection import DBConnection
+from ..db.query import _get_module_states
 from ..launch import bootstrap_and_prep_launch_cmd
 from ..shell.shell import odoo_shell
 
@@ -14,6 +17,69 @@ CLI = CommonCLI()
 LOGGER = logging.getLogger(__name__)
 
 
+def _generate_test_data_script(module_names: List[str]) -> str:
+    """Odoo shell script, that calls `tests.data.generate_test_data(env)` for all modules in one Odoo session.
+    Commits after each module and stops on the first module that fails.
+
+    Parameters
+    ----------
+    module_names : List[str]
+        Modules to generate test data for
+
+    Returns
+    -------
+    str
+        Python code for odoo-bin shell
+    """
+    return f"""
+import importlib
+import logging
+
+_logger = logging.getLogger('godoo.test_data')
+for module_name in {module_names!r}:
+    _logger.info('Calling Test Data Generator for Module: %s', module_name)
+    try:
+        importlib.import_module('odoo.addons.' + module_name + '.tests.data').generate_test_data(env)
+    except Exception:
+        _logger.exception('Failed to generate test data for module: %s', module_name)
+        raise
+    env.cr.commit()
+"""
+
+
+def _modules_up_to_date(db_connection: DBConnection, modules: List[godooModule], odoo_series: str) -> bool:
+    """Check if all modules are installed in the database with the version of their manifest.
+    Like Odoo, manifest versions without the series prefix are compared as <odoo_series>.<version>.
+
+    Parameters
+    ----------
+    db_connection : DBConnection
+        Connection to a bootstrapped Odoo database
+    modules : List[godooModule]
+        Modules to check
+    odoo_series : str
+        Odoo series like 16.0
+
+    Returns
+    -------
+    bool
+        True if no module needs to be installed or upgraded
+    """
+    db_states = _get_module_states(db_connection, [m.name for m in modules])
+    for module in modules:
+        state, db_version = db_states.get(module.name, (None, None))
+        if state != "installed":
+            LOGGER.debug("Module '%s' has state '%s'", module.name, state)
+            return False
+        version = module.manifest.get("version")
+        if version and (version == odoo_series or not version.startswith(f"{odoo_series}.")):
+            version = f"{odoo_series}.{version}"
+        if version and db_version != version:
+            LOGGER.debug("Module '%s' version '%s' differs from manifest '%s'", module.name, db_version, version)
+            return False
+    return True
+
+
 @CLI.arg_annotator
 def odoo_load_test_data(
     test_modules: List[str] = typer.Argument(
@@ -40,6 +106,10 @@ def odoo_load_test_data(
     db_password=CLI.database.db_password,
     odoo_log_level: str = typer.Option("test", help="Log level"),
     multithread_worker_count=CLI.odoo_launch.multithread_worker_count,
+    skip_upgrade_if_current: bool = typer.Option(
+        False,
+        help="Skip the module upgrade if the installed versions match their manifests. Ignored with extra launch args",
+    ),
 ):
     """Loads Test Data from test/data.py of given modules into Odoo DB.
 
@@ -52,18 +122,14 @@ def odoo_load_test_data(
         workspace_addon_path=workspace_addon_path,
         thirdparty_addon_path=thirdparty_addon_path,
     )
-    godoo_test_modules = list(godooModules(addon_paths).get_modules(test_modules))
+    godoo_test_modules = list(get_module_registry(addon_paths).get_modules(test_modules))
     test_module_names = [m.name for m in godoo_test_modules]
     module_list_csv = ",".join(test_module_names)
     LOGGER.info("Installing Test data for Odoo Modules:\n%s", sorted(test_module_names))
 
-    missing = False
-    for module in godoo_test_modules:
-        data_file = module.path / "tests" / "data.py"
-        if not data_file.exists():
-            missing = True
+    if missing := [m for m in godoo_test_modules if not os.path.isfile(m.test_data_file)]:
+        for module in missing:
             LOGGER.error("Test Data.py file not found for module: %s", module)
-    if missing:
         return CLI.returner(1)
 
     bootstrap_args = [
@@ -105,19 +171,30 @@ def odoo_load_test_data(
         odoo_demo=False,
         launch_or_bootstrap=True,
     )
-    if isinstance(launch_cmd, str):
-        LOGGER.info("Ensuring modules are intalled")
-        launch_cmd = run_cmd(launch_cmd, shell=True).returncode
+    if isinstance(launch_cmd, list):
+        # Code and data change without a version bump during development, so only skip on request
+        if (
+            skip_upgrade_if_current
+            and not extra_launch_args
+            and _modules_up_to_date(db_connection, godoo_test_modules, odoo_bin_get_version(odoo_main_path).raw)
+        ):
+            LOGGER.info("Modules are already installed and up to date")
+            launch_cmd = 0
+        else:
+            LOGGER.info("Ensuring modules are intalled")
+            launch_cmd = run_cmd(launch_cmd).returncode
 
     if launch_cmd != 0:
         LOGGER.error("Failed to Launch or Bootstrap Odoo")
         LOGGER.debug("Launch Return: %s", launch_cmd)
         return CLI.returner(launch_cmd)
 
-    for module in godoo_test_modules:
-        load_cmd = f"from odoo.addons.{module.name}.tests.data import generate_test_data; generate_test_data(env);env.cr.commit()"
-        LOGGER.info("Calling Test Data Generator for Module: %s", module)
-        ret = odoo_shell(pipe_in_command=load_cmd, odoo_main_path=odoo_main_path, odoo_conf_path=odoo_conf_path)
-        if ret != 0:
-            LOGGER.error("Failed to generate test data for module: %s", module)
-            return CLI.returner(ret)
+    LOGGER.info("Calling Test Data Generators for Modules: %s", test_module_names)
+    ret = odoo_shell(
+        pipe_in_command=_generate_test_data_script(test_module_names),
+        odoo_main_path=odoo_main_path,
+        odoo_conf_path=odoo_conf_path,
+    )
+    if ret != 0:
+        LOGGER.error("Failed to generate test data for modules: %s", test_module_names)
+        return CLI.returner(ret)
@@ -1,5 +1,5 @@
 import logging
-import re
+import sys
 from pathlib import Path
 from typing import List
 
@@ -7,7 +7,7 @@ import typer
 from typing_extensions import Annotated, Optional
 
 from ...cli_common import CommonCLI
-from ...helpers.modules import get_addon_paths, godooModules
+from ...helpers.modules import get_addon_paths, get_module_registry, godooModules
 from ...helpers.modules_git import get_changed_modules_and_depends
 from ...helpers.system import run_cmd
 from ..db.connection import DBConnection
@@ -25,8 +25,8 @@ def _test_modules_special_cases(in_modules: List[str], workspace_addon_path: Pat
         command = in_modules[0]
         if command == "all":
             out_modules = godooModules(workspace_addon_path).get_modules()
-        elif re_match := re.match(r"changes\:(.*)", command):
-            compare_branch = re_match.group(1)
+        elif command.startswith("changes:"):
+            compare_branch = command[len("changes:") :]
             changed_modules = get_changed_modules_and_depends(
                 diff_ref=compare_branch,
                 addon_path=workspace_addon_path,
@@ -47,7 +47,7 @@ def odoo_get_changed_modules(
     changed_modules = get_changed_modules_and_depends(diff_ref=diff_ref, addon_path=workspace_addon_path)
     if not changed_modules:
         return
-    print("\n".join(sorted([p.name for p in changed_modules])))  # pylint: disable=print-used
+    sys.stdout.writelines(f"{name}\n" for name in sorted(p.name for p in changed_modules))
 
 
 @CLI.arg_annotator
@@ -88,13 +88,6 @@ def odoo_run_tests(
     """
 
     test_module_names = _test_modules_special_cases(test_module_names, workspace_addon_path)
-    addon_paths = get_addon_paths(odoo_main_path, workspace_addon_path, thirdparty_addon_path)
-    module_reg = godooModules(addon_paths)
-    test_modules = list(module_reg.get_modules(test_module_names))
-    depends = []
-    for mod in test_modules:
-        depends += module_reg.get_module_dependencies(mod)
-    depends = list(set(depends))
 
     if skip_test_modules:
         skip_test_modules = [m for m in skip_test_modules if m in test_module_names]
@@ -102,18 +95,27 @@ def odoo_run_tests(
         # First check if skippable modules are in the test_modules
         if skip_test_modules:
             LOGGER.info("Skipping Tests for Modules:\n%s", skip_test_modules)
-            test_modules = [m for m in test_modules if m.name not in skip_test_modules]
+            test_module_names = [m for m in test_module_names if m not in skip_test_modules]
 
-    if not test_modules:
+    # Check before scanning addon paths. Also get_modules() would return all modules for an empty list.
+    if not test_module_names:
         LOGGER.info("Nothing to Test. Skipping.")
         return
 
-    module_names = [m.name for m in test_modules]
-    test_module_list = ",".join(["/" + m for m in module_names])
+    addon_paths = get_addon_paths(odoo_main_path, workspace_addon_path, thirdparty_addon_path)
+    module_reg = get_module_registry(addon_paths)
+    # get_modules raises for unknown names, so the names can be used as they are below.
+    # The dependency walk stops at the first hit.
+    needs_chart_of_accounts = any(
+        dep.name == "account" for dep in module_reg.iter_module_dependencies(module_reg.get_modules(test_module_names))
+    )
+
+    module_names = test_module_names
     module_list = ",".join(module_names)
+    test_tags_arg = "--test-tags /" + ",/".join(module_names)
 
     LOGGER.info("Testing Odoo Modules:\n%s", sorted(module_names))
-    if "account" in [p.name for p in depends]:
+    if needs_chart_of_accounts:
         bootstrap_args = [f"--init {module_list},l10n_generic_coa"]
     else:
         bootstrap_args = [f"--init {module_list}"]
@@ -122,7 +124,7 @@ def odoo_run_tests(
     launch_args = [
         f"-u {module_list}",
         f"--log-level {odoo_log_level}",
-        f"--test-tags {test_module_list}",
+        test_tags_arg,
         "--stop-after-init",
     ]
 
@@ -134,7 +136,7 @@ def odoo_run_tests(
         # If we dont pregenerate assets, we can run the Tests directly in Bootstrap
         # This saves one Upgrade iteration
         launch_or_bootstrap = True
-        bootstrap_args.append(f"--test-tags {test_module_list}")
+        bootstrap_args.append(test_tags_arg)
 
     if extra_bootstrap_args:
         bootstrap_args = extra_bootstrap_args + bootstrap_args
@@ -163,7 +165,7 @@ def odoo_run_tests(
         languages=languages,
         launch_or_bootstrap=launch_or_bootstrap,
     )
-    if isinstance(launch_cmd, str):
+    if isinstance(launch_cmd, list):
         if pregenerate_assets:
             odoo_pregenerate_assets(odoo_main_path)
         LOGGER.info("Launching Odoo Tests")
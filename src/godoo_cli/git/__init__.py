@@ -1,4 +1,4 @@
 from .git_odoo import git_ensure_odoo_repo
 from .git_odoo_addons import git_ensure_addon_repos
 from .git_repo import git_ensure_repo
-from .git_url import GitUrl
+from .git_url import GitUrl, get_git_url
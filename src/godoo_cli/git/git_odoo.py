@@ -1,8 +1,15 @@
 import logging
+import os
 from pathlib import Path
 
-from ..helpers.odoo_manifest import yaml_add_compare_commit, yaml_remove_compare_commit, yaml_roundtrip_loader
+from ..helpers.odoo_manifest import (
+    dump_manifest_yml,
+    load_manifest_yml,
+    yaml_add_compare_commit,
+    yaml_remove_compare_commit,
+)
 from .git_repo import git_ensure_repo
+from .zip_download import remove_leftover_deletes, wait_for_pending_deletes
 
 LOGGER = logging.getLogger(__name__)
 
@@ -14,8 +21,7 @@ def git_ensure_odoo_repo(
     add_compare_comment: bool,
     download_archive: bool,
 ):
-    yaml = yaml_roundtrip_loader()
-    git_repos = yaml.load(manifest_file.resolve())
+    yaml, git_repos = load_manifest_yml(manifest_file)
     if not git_repos:
         raise FileNotFoundError(f"Couldnt load yml file from: {str(manifest_file)}")
 
@@ -32,23 +38,31 @@ def git_ensure_odoo_repo(
     else:
         yaml_remove_compare_commit(odoo_data)
 
-    git_ensure_repo(
-        target_folder=target_folder,
-        repo_src=odoo_url,
-        branch=odoo_branch,
-        commit=odoo_commit,
-        pull=force_fetch,
-        zip_mode=download_archive,
-        filter="blob:none",
-        single_branch=True,
-    )
+    if target_folder.parent.is_dir():
+        remove_leftover_deletes(target_folder.parent, target_folder.name)
+    try:
+        git_ensure_repo(
+            target_folder=target_folder,
+            repo_src=odoo_url,
+            branch=odoo_branch,
+            commit=odoo_commit,
+            pull=force_fetch,
+            zip_mode=download_archive,
+            filter="blob:none",
+            single_branch=True,
+            shallow=True,
+        )
+    finally:
+        wait_for_pending_deletes()
 
     # make sure odoo-bin is executable
     odoo_bin = target_folder / "odoo-bin"
-    if odoo_bin.exists():
-        LOGGER.debug("chmod odoo-bin +executable")
-        odoo_bin.chmod(0o755)
-    else:
+    try:
+        odoo_bin_mode = os.stat(odoo_bin).st_mode
+        if odoo_bin_mode & 0o755 != 0o755:
+            LOGGER.debug("chmod odoo-bin +executable")
+            odoo_bin.chmod(odoo_bin_mode | 0o755)
+    except FileNotFoundError:
         LOGGER.warning("Could not find odoo-bin in %s", target_folder)
 
-    yaml.dump(git_repos, manifest_file)
+    dump_manifest_yml(yaml, git_repos, manifest_file)
@@ -1,22 +1,28 @@
 import concurrent.futures
 import logging
+import os
 from pathlib import Path
 from typing import Dict
 
 from git import Commit
 
-from ..helpers.odoo_manifest import update_yml, yaml_roundtrip_loader
+from ..helpers.odoo_manifest import dump_manifest_yml, load_manifest_yml, update_yml
 from .git_repo import git_ensure_repo
-from .git_url import GitUrl
+from .git_url import get_git_url
+from .zip_download import remove_leftover_deletes, wait_for_pending_deletes
 
 LOGGER = logging.getLogger(__name__)
 
+# Clones are mostly waiting on network and git subprocesses, so use more threads than cores
+DEFAULT_CLONE_WORKERS = max(8, min(16, (os.cpu_count() or 4) * 2))
+
 
 def git_ensure_addon_repos(
     root_folder: Path,
     git_yml_path: Path,
     generate_yml_compare_comments: bool = False,
     download_archive: bool = False,
+    clone_workers: int = 0,
 ):
     """
     Clone repos specified in Yml.
@@ -31,13 +37,26 @@ def git_ensure_addon_repos(
         wether to add three dot compare on remote to repo urls
     download_archive : bool, optional
         wether to download as .zip (fast but no history), by default False
+    clone_workers : int, optional
+        how many repos to clone in parallel, by default 0 (DEFAULT_CLONE_WORKERS)
     """
-    yaml = yaml_roundtrip_loader()
-    git_repos = yaml.load(git_yml_path.resolve())
-    if _git_clone_addon_repos(root_folder=root_folder, git_repos=git_repos, download_archive=download_archive):
+    yaml, git_repos = load_manifest_yml(git_yml_path)
+    if root_folder.is_dir():
+        remove_leftover_deletes(root_folder)
+    try:
+        clone_results = _git_clone_addon_repos(
+            root_folder=root_folder,
+            git_repos=git_repos,
+            download_archive=download_archive,
+            clone_workers=clone_workers,
+        )
+    finally:
+        # Replaced .zip checkouts get deleted in the background inside root_folder. Callers scan it next.
+        wait_for_pending_deletes()
+    if clone_results:
         update_yml(git_repos, generate_yml_compare_comments)
         LOGGER.info("Updating Git Thirdparty Repo Commit hashes")
-        yaml.dump(git_repos, git_yml_path)
+        dump_manifest_yml(yaml, git_repos, git_yml_path)
 
     return git_repos
 
@@ -46,10 +65,11 @@ def _git_clone_addon_repos(
     root_folder: Path,
     git_repos: Dict[str, Dict[str, str]],
     download_archive: bool = False,
+    clone_workers: int = 0,
 ) -> Dict[str, Commit]:
     """
     Clones Git repos specified in dict into Root folder.
-    Ensures repo names are prefixed and uses 8 threads to clone.
+    Ensures repo names are prefixed and clones in parallel threads.
 
     Parameters
     ----------
@@ -61,6 +81,8 @@ def _git_clone_addon_repos(
         branch defaults to odoo branch from spec file
     download_archive : bool, optional
         wether to download as .zip (fast but no history), by default False
+    clone_workers : int, optional
+        how many repos to clone in parallel, by default 0 (DEFAULT_CLONE_WORKERS)
     Returns
     -------
     Dict[str:Commit]
@@ -68,28 +90,40 @@ def _git_clone_addon_repos(
     """
     default_branch = git_repos["odoo"].get("branch")
     LOGGER.info("Cloning Thirdparty Addons source.")
-    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+    thirdparty_repos = git_repos.get("thirdparty")
+    if not thirdparty_repos:
+        LOGGER.info("No Thirdparty Key in manifest. Skipping...")
+        return
+    repo_list = [(prefix, repo) for prefix, repos in thirdparty_repos.items() for repo in repos]
+    if not repo_list:
+        return {}
+    max_workers = min(clone_workers or DEFAULT_CLONE_WORKERS, len(repo_list))
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
         futures = []
-        thirdparty_repos = git_repos.get("thirdparty")
-        if not thirdparty_repos:
-            LOGGER.info("No Thirdparty Key in manifest. Skipping...")
-            return
-        for prefix, repos in thirdparty_repos.items():
-            for repo in repos:
-                repo_url = GitUrl(repo["url"])
-                name = f"{prefix}_{repo_url.name}"
-                futures.append(
-                    executor.submit(
-                        git_ensure_repo,
-                        target_folder=Path(root_folder / name),
-                        repo_src=repo_url.url,
-                        branch=repo.get("branch", default_branch),
-                        commit=repo.get("commit"),
-                        zip_mode=download_archive,
-                        filter="blob:none",
-                        single_branch=True,
-                    )
+        for prefix, repo in repo_list:
+            repo_url = get_git_url(repo["url"])
+            name = f"{prefix}_{repo_url.name}"
+            futures.append(
+                executor.submit(
+                    git_ensure_repo,
+                    target_folder=root_folder / name,
+                    repo_src=repo_url.url,
+                    branch=repo.get("branch", default_branch),
+                    commit=repo.get("commit"),
+                    zip_mode=download_archive,
+                    filter="blob:none",
+                    single_branch=True,
+                    shallow=True,
                 )
-        clone_results = [f.result() for f in futures]
-        clone_results = {r[0]: r[1] for r in clone_results if r}
+            )
+        clone_results = {}
+        try:
+            # Collect in completion order, so a failing clone surfaces without waiting for slower ones
+            for future in concurrent.futures.as_completed(futures):
+                if res := future.result():
+                    clone_results[res[0]] = res[1]
+        except Exception:
+            LOGGER.error("Cloning Thirdparty Addons failed. Cancelling pending clones.")
+            executor.shutdown(cancel_futures=True)
+            raise
     return clone_results
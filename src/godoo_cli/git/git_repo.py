@@ -1,16 +1,21 @@
-""" Module to provide GIT interaction."""
+"""Module to provide GIT interaction."""
 
 import logging
 import shutil
 from pathlib import Path
 
 from git import GitCommandError, InvalidGitRepositoryError, Repo
+from git.refs import RemoteReference
 
-from .git_url import GitUrl
+from .git_url import get_git_url
 from .zip_download import git_download_zip
 
 LOGGER = logging.getLogger(__name__)
 
+# Written into every fresh clone. Pulls of new commits and pinned SHAs then negotiate with fewer round trips.
+# protocol.version=2 and pack.threads=0 (all cores) are git defaults already.
+CLONE_REPO_CONFIG = {("fetch", "negotiationAlgorithm"): "skipping"}
+
 
 def _git_clean_clone(repo_src: str, target_folder: Path, **kwargs):
     """Clears targetfolder and does a clean clone_from
@@ -26,8 +31,8 @@ def _git_clean_clone(repo_src: str, target_folder: Path, **kwargs):
 
     Returns
     -------
-    _type_re
-        _description_
+    Repo
+        Cloned Repo with CLONE_REPO_CONFIG applied
     """
     LOGGER.debug("Cloning Repo: %s, to '%s', Kwargs: '%s'", repo_src, target_folder, kwargs)
     if not isinstance(target_folder, Path):
@@ -35,7 +40,17 @@ def _git_clean_clone(repo_src: str, target_folder: Path, **kwargs):
     if target_folder.exists():
         LOGGER.debug("Clearing Repo folder: %s", target_folder)
         shutil.rmtree(target_folder)
-    return Repo.clone_from(repo_src, target_folder, **kwargs)
+    repo = Repo.clone_from(repo_src, target_folder, **kwargs)
+    with repo.config_writer() as config:
+        for (section, option), value in CLONE_REPO_CONFIG.items():
+            config.set_value(section, option, value)
+    return repo
+
+
+def _is_commit(current_sha: str, commit: str) -> bool:
+    """Check if commit (full or abbreviated SHA) refers to current_sha, without asking git."""
+    commit = str(commit)
+    return len(commit) >= 4 and str(current_sha).startswith(commit)
 
 
 def git_pull_checkout_reset(
@@ -75,7 +90,7 @@ def git_pull_checkout_reset(
             else:
                 raise e
     if commit:
-        if str(repo.head.commit) != str(commit):
+        if not _is_commit(repo.head.commit.hexsha, commit):
             LOGGER.debug("Checking out %s to Commit: %s", repo.git_dir, commit)
             repo.git.checkout(commit)
         return
@@ -90,6 +105,7 @@ def git_ensure_ref(
     branch: str = "master",
     commit: str = "",
     pull: str = "",
+    shallow: bool = False,
     **kwargs,
 ):
     """
@@ -108,6 +124,8 @@ def git_ensure_ref(
         specific target to pull. Usually used in conjunction with branch.
     branch : str, optional
         branch on which to set head, by default 'master'
+    shallow : bool, optional
+        clone only the branch tip (--depth 1) when no commit is pinned, by default False
     **kwargs
         get passed to git clone
     """
@@ -115,40 +133,53 @@ def git_ensure_ref(
     target_folder.mkdir(exist_ok=True, parents=True)
     try:
         repo = Repo(target_folder)
-        current = str(repo.head.commit)
-
-        if not pull and commit and str(commit) != str(current):
+        current = repo.head.commit.hexsha
+
+        if not pull and commit:
+            if _is_commit(current, commit):
+                # Pinned commit is already checked out. No need to fetch or checkout, but keep the tree clean.
+                if repo.is_dirty(untracked_files=False):
+                    LOGGER.debug("Resetting local changes in: %s", repo.working_dir)
+                    repo.git.reset("--hard", "HEAD")
+                LOGGER.debug("Repo Commit matches. Skipping: '%s' --> '%s'", repo_src, current)
+                return repo_src, repo.head.commit
             pull = str(commit)
 
         if not pull and branch and not commit:
             remote_name = str(repo.remotes[0].name)
             try:
-                remote_commit = repo.git.rev_parse(remote_name + "/" + str(branch))
+                # Read the ref in Python, instead of spawning git rev-parse for every repo
+                remote_commit = RemoteReference(repo, f"refs/remotes/{remote_name}/{branch}").commit.hexsha
             except Exception:
                 remote_commit = "unknown"
             LOGGER.debug(
                 "Repo: %s comparing local head '%s' with remote head '%s'", repo.working_dir, current, remote_commit
             )
-            if str(remote_commit) != current:
+            if remote_commit != current:
                 pull = str(branch)
 
         git_pull_checkout_reset(repo=repo, branch=branch, commit=commit, pull=pull)
 
-        if current == str(repo.head.commit):
+        head_commit = repo.head.commit
+        if current == head_commit.hexsha:
             LOGGER.debug("Repo Commit matches. Skipping: '%s' --> '%s'", repo_src, current)
         else:
-            LOGGER.info("Pulled Repo from: '%s'. Head is now at: %s", repo_src, repo.head.commit)
+            LOGGER.info("Pulled Repo from: '%s'. Head is now at: %s", repo_src, head_commit)
     except InvalidGitRepositoryError:
+        if shallow and not commit:
+            # Without a pinned commit only the branch tip gets checked out, so the history isn't needed
+            kwargs.setdefault("depth", 1)
         repo = _git_clean_clone(repo_src, target_folder, branch=branch, **kwargs)
         git_pull_checkout_reset(repo=repo, branch=branch, commit=commit)
 
+        head_commit = repo.head.commit
         LOGGER.info(
             "Cloned Repo: '%s'. Branch='%s' Head='%s'",
             repo_src,
             repo.active_branch.name if not repo.head.is_detached else "Detached",
-            repo.head.commit,
+            head_commit,
         )
-    return repo_src, repo.head.commit
+    return repo_src, head_commit
 
 
 def git_ensure_repo(
@@ -183,11 +214,7 @@ def git_ensure_repo(
     if isinstance(target_folder, str):
         target_folder = Path(target_folder)
 
-    if target_folder.exists() and any(target_folder.iterdir()) and not target_folder.glob(".git"):
-        LOGGER.info("Assuming '%s' got pulled in .Zip mode. Skipping Clone and commit check.", target_folder)
-        zip_mode = True
-
-    if zip_mode and GitUrl(repo_src).url_type == "ssh":
+    if zip_mode and get_git_url(repo_src).url_type == "ssh":
         LOGGER.info("Zip downloading currently not supported for SSH type Urls")
         zip_mode = False
 
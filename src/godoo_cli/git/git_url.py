@@ -1,7 +1,10 @@
+import functools
 import re
 from enum import Enum
 from typing import Literal
 
+SSH_URL_RE = re.compile(r"(?P<user>\w+)@(?P<domain>[^:]+):(?:(?P<port>\d+)]?:)?(?P<path>.*)")
+
 
 class GitRemoteType(Enum):
     gitlab = "gitlab"
@@ -14,6 +17,8 @@ class GitUrl:
     Can generate Compare Urls
     """
 
+    __slots__ = ("url", "url_type", "domain", "path", "user", "port", "name", "_http_url", "_remote_type")
+
     url: str
     url_type: Literal["http", "ssh"]
     domain: str
@@ -25,28 +30,31 @@ class GitUrl:
     def __init__(self, url: str) -> None:
         self.url = url
         if "http" in url:
-            http_regex = r"(?P<schema>https?):\/\/(?P<domain>[^\/]+)(?P<path>.*)"
-            http_match = re.search(http_regex, url)
-            self.url_type = http_match.group("schema")
-            self.domain = http_match.group("domain")
-            self.path = http_match.group("path")
+            schema, _, rest = url.partition("://")
+            self.url_type = schema[schema.rfind("http") :]
+            if self.url_type not in ("http", "https"):
+                raise ValueError(f"Cant parse HTTP(s) Git URL: {url}")
+            self.domain, _, self.path = rest.partition("/")
         else:
-            ssh_regex = r"(?P<user>\w+)@(?P<domain>[^:]+):(?:(?P<port>\d+)]?:)?(?P<path>.*)"
-            ssh_match = re.search(ssh_regex, url)
+            ssh_match = SSH_URL_RE.search(url)
             self.url_type = "ssh"
             self.domain = ssh_match.group("domain")
             self.path = ssh_match.group("path")
             self.user = ssh_match.group("user")
             self.port = ssh_match.group("port")
 
-        if self.path.endswith(".git"):  # Todo Python 3.9 Use Removesuffix and RemovePrefix
-            self.path = self.path[:-4]
-        if self.path.endswith("/"):
-            self.path = self.path[:-1]
-        if self.path.startswith("/"):
-            self.path = self.path[1:]
+        self.path = self.path.removesuffix(".git").removesuffix("/").removeprefix("/")
         self.name = self.path.split("/")[-1]
+        # Computed once here, as the URL helpers need them on every call
+        self._http_url = f"https://{self.domain}/{self.path}"
+        if "gitlab" in self.domain:
+            self._remote_type = GitRemoteType.gitlab
+        elif "github" in self.domain:
+            self._remote_type = GitRemoteType.github
+        else:
+            self._remote_type = None
 
+    @property
     def _clean_http_url(self) -> str:
         """Return HTTPs URL without .git suffix.
 
@@ -55,8 +63,9 @@ class GitUrl:
         str
             Https:// url
         """
-        return f"https://{self.domain}/{self.path}"
+        return self._http_url
 
+    @property
     def _git_type(self) -> GitRemoteType:
         """Get git Remote type.
 
@@ -70,12 +79,9 @@ class GitUrl:
         ValueError
             If Type cannot be determined.
         """
-        if "gitlab" in self.domain:
-            return GitRemoteType.gitlab
-        elif "github" in self.domain:
-            return GitRemoteType.github
-        else:
+        if not self._remote_type:
             raise ValueError(f"Cant get Git Service type from {self.domain}")
+        return self._remote_type
 
     def get_compare_url(self, from_compare: str, to_compare: str) -> str:
         """Get Compare url between two Refs.
@@ -92,10 +98,10 @@ class GitUrl:
         str
             Compare Url Like: https://github.com/odoo/odoo/compare/<commitSHA>...<branchName>
         """
-        remote_type = self._git_type()
+        remote_type = self._git_type
         if from_compare == to_compare:
             return  # Nothing to Compare here
-        http_url = self._clean_http_url()
+        http_url = self._clean_http_url
         if remote_type in [GitRemoteType.github, GitRemoteType.gitlab]:
             return f"{http_url}/compare/{from_compare}...{to_compare}"
 
@@ -121,8 +127,8 @@ class GitUrl:
         """
         if not ref:
             raise ValueError("Missing either download ref (e.g. branch or commit) to generate Archive URL.")
-        http_url = self._clean_http_url()
-        remote_type = self._git_type()
+        http_url = self._clean_http_url
+        remote_type = self._git_type
         if remote_type == GitRemoteType.github:
             return f"{http_url}/archive/{ref }.zip"
         if remote_type == GitRemoteType.gitlab:
@@ -144,9 +150,26 @@ class GitUrl:
             URL Pointing to the Raw file contents on the Remote
         """
 
-        http_url = self._clean_http_url()
-        remote_type = self._git_type()
+        http_url = self._clean_http_url
+        remote_type = self._git_type
         if remote_type == GitRemoteType.github:
             return f"{http_url.replace(self.domain,'raw.githubusercontent.com')}/{ref}/{file_path}"
         if remote_type == GitRemoteType.gitlab:
             return f"{http_url}/-/raw/{ref}/{file_path}"
+
+
+@functools.lru_cache(maxsize=None)
+def get_git_url(url: str) -> GitUrl:
+    """Get a shared GitUrl for url, so repeated lookups of the same URL only parse once.
+
+    Parameters
+    ----------
+    url : str
+        SSH or HTTP(s) git URL
+
+    Returns
+    -------
+    GitUrl
+        Cached GitUrl. Treat as read only.
+    """
+    return GitUrl(url)
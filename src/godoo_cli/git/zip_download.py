@@ -1,14 +1,119 @@
+import concurrent.futures
 import logging
+import os
 import shutil
+import sys
 import tempfile
+import threading
 import zipfile
 from pathlib import Path
+from typing import List
 
-from ..helpers.system import download_file
-from .git_url import GitUrl
+from ..helpers.system import download_fileobj
+from .git_url import get_git_url
 
 LOGGER = logging.getLogger(__name__)
 
+# Repo archives (odoo in particular) are hundreds of MB, so read them in big chunks
+ARCHIVE_CHUNK_SIZE = 1 << 20
+ARCHIVE_SPOOL_MAX_SIZE = 64 << 20
+# zlib and file writes release the GIL, so archive members can be extracted in threads
+ARCHIVE_EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Background deletes of replaced checkouts. Joined by wait_for_pending_deletes()
+_PENDING_DELETES: List[threading.Thread] = []
+_PENDING_DELETES_LOCK = threading.Lock()
+
+
+def _extract_zip_member(zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, path: Path):
+    """Extract a single archive member to path. Safe to run from several threads."""
+    try:
+        zip_ref.extract(member, path)
+    except FileExistsError:
+        # Another worker created the same parent folder in between. It exists now, so retry once.
+        zip_ref.extract(member, path)
+
+
+def _extract_zip(zip_ref: zipfile.ZipFile, path: Path):
+    """Extract all members of zip_ref to path. Uses ARCHIVE_EXTRACT_WORKERS threads on multi core hosts.
+
+    Parameters
+    ----------
+    zip_ref : zipfile.ZipFile
+        opened archive
+    path : Path
+        extraction target
+    """
+    if ARCHIVE_EXTRACT_WORKERS < 2:
+        zip_ref.extractall(path)
+        return
+    members = zip_ref.infolist()
+    # Folders first and serially, so workers don't race creating them
+    file_members = []
+    for member in members:
+        if member.is_dir():
+            zip_ref.extract(member, path)
+        else:
+            file_members.append(member)
+    with concurrent.futures.ThreadPoolExecutor(ARCHIVE_EXTRACT_WORKERS) as executor:
+        for future in [executor.submit(_extract_zip_member, zip_ref, member, path) for member in file_members]:
+            future.result()
+
+
+def _archive_tempfile():
+    """Temp file to download a repo archive into.
+    Small archives stay in memory. Big ones (odoo itself) spill to disk, since zip needs a seekable file.
+    SpooledTemporaryFile only implements seekable() from Python 3.11 on, so older versions always use disk.
+    """
+    if sys.version_info >= (3, 11):
+        return tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_MAX_SIZE)
+    return tempfile.TemporaryFile()
+
+
+def _move_aside_and_delete(folder: Path):
+    """Rename folder out of the way and delete it in a background thread.
+    Big checkouts take a while to delete, this way the new one can take its place right away.
+
+    Parameters
+    ----------
+    folder : Path
+        folder to remove. Nothing happens if it doesn't exist.
+    """
+    if not folder.exists():
+        return
+    tomb = Path(tempfile.mkdtemp(prefix=f".{folder.name}.old.", dir=folder.parent))
+    folder.rename(tomb / folder.name)
+    # The tomb sits next to the new checkout, so callers join the delete before scanning that folder again
+    delete_thread = threading.Thread(target=shutil.rmtree, args=(tomb,), kwargs={"ignore_errors": True})
+    delete_thread.start()
+    with _PENDING_DELETES_LOCK:
+        _PENDING_DELETES.append(delete_thread)
+
+
+def wait_for_pending_deletes():
+    """Block until all folders moved aside by _move_aside_and_delete are gone."""
+    with _PENDING_DELETES_LOCK:
+        delete_threads = _PENDING_DELETES[:]
+        _PENDING_DELETES.clear()
+    for delete_thread in delete_threads:
+        delete_thread.join()
+
+
+def remove_leftover_deletes(parent_folder: Path, name: str = "*"):
+    """Remove folders that _move_aside_and_delete left behind, e.g. because the process got killed mid delete.
+
+    Parameters
+    ----------
+    parent_folder : Path
+        folder that holds the checkouts
+    name : str, optional
+        only clean up leftovers of this checkout folder, by default "*" (all of them)
+    """
+    for tomb in parent_folder.glob(f".{name}.old.*"):
+        if tomb.is_dir():
+            LOGGER.debug("Removing leftover folder: %s", tomb)
+            shutil.rmtree(tomb, ignore_errors=True)
+
 
 def git_download_zip(repo_url: str, target_folder: Path, branch: str, commit: str = ""):
     """Download Repo Zip from Github.
@@ -29,21 +134,21 @@ def git_download_zip(repo_url: str, target_folder: Path, branch: str, commit: st
     FileNotFoundError
         If Download failed
     """
-    git_url = GitUrl(repo_url)
+    git_url = get_git_url(repo_url)
     download_url = git_url.get_archive_url(ref=commit or branch)
-    with tempfile.TemporaryDirectory() as tdir:
-        zip_path = Path(tdir) / f"{git_url.name}.zip"
+    target_folder.parent.mkdir(parents=True, exist_ok=True)
+    with _archive_tempfile() as zip_file:
         LOGGER.info("Downloading GitRepo Zip: '%s'", download_url)
-        LOGGER.debug("Target Path: '%s' ", zip_path)
-        download_file(download_url, zip_path)
-        if not zip_path.exists():
+        if not download_fileobj(download_url, zip_file, chunk_size=ARCHIVE_CHUNK_SIZE):
             raise FileNotFoundError(f"Could not download Repo Zip from: {download_url}")
         LOGGER.info("Extracting GitRepo Zip: %s", git_url.name)
-        ex_location = Path(tdir) / "extract"
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(ex_location)
-        for path in ex_location.glob("*"):
-            LOGGER.info("Moving %s to %s", path.stem, target_folder)
-            shutil.rmtree(target_folder, ignore_errors=True)
-            path.rename(target_folder)
-            break
+        zip_file.seek(0)
+        # Extract next to target_folder, so the final rename stays on one filesystem
+        with zipfile.ZipFile(zip_file, "r") as zip_ref, tempfile.TemporaryDirectory(dir=target_folder.parent) as tdir:
+            ex_location = Path(tdir) / "extract"
+            _extract_zip(zip_ref, ex_location)
+            for path in ex_location.glob("*"):
+                LOGGER.info("Moving %s to %s", path.stem, target_folder)
+                _move_aside_and_delete(target_folder)
+                path.rename(target_folder)
+                break
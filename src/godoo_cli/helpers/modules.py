@@ -1,9 +1,12 @@
 """Helps Finding Modules folders and analyzing their dependencies"""
 
+import functools
+import os
 from ast import literal_eval
+from collections import deque
 from logging import getLogger
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
 
 LOGGER = getLogger(__name__)
 
@@ -12,6 +15,13 @@ class NotAValidModuleError(ValueError):
     """Raised when a path is not a valid odoo module folder"""
 
 
+@functools.lru_cache(maxsize=None)
+def _read_manifest(manifest_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a __manifest__.py. mtime_ns is only part of the cache key, so edited manifests are read again."""
+    with open(manifest_file, encoding="utf-8") as f:
+        return literal_eval(f.read())
+
+
 class godooModule:
     """Encapsulates a odoo module folder"""
 
@@ -22,29 +32,41 @@ class godooModule:
 
     def validate_is_module(self):
         """Throws NotAModuleError if path is not a valid odoo module folder"""
-        if not self.path.is_dir() or not self.manifest_file.exists():
+        # A manifest file can only exist in a folder, so this single stat covers both checks
+        if not os.path.isfile(os.path.join(self.path, "__manifest__.py")):
             raise NotAValidModuleError(f"{self.path} is not a valid odoo module")
 
+    @functools.cached_property
+    def _absolute_path(self) -> str:
+        """Absolute path as str. Computed once, as it's used for every hash and comparison."""
+        return str(self.path.absolute())
+
     def __repr__(self) -> str:
-        return f"godooModule({str(self.path.absolute())})"
+        return f"godooModule({self._absolute_path})"
 
     def __eq__(self, __value: object) -> bool:
         if isinstance(__value, godooModule):
-            return self.path.absolute() == __value.path.absolute()
+            return self._absolute_path == __value._absolute_path
         return False
 
     def __hash__(self) -> int:
-        return hash(self.path.absolute())
+        return hash(self._absolute_path)
 
     @property
     def manifest_file(self) -> Path:
         return self.path / "__manifest__.py"
 
     @property
-    def manifest(self) -> Dict[str, Any]:
-        return literal_eval(self.manifest_file.read_text())
+    def test_data_file(self) -> Path:
+        return self.path / "tests" / "data.py"
 
     @property
+    def manifest(self) -> Dict[str, Any]:
+        """Parsed manifest. Cached per file and mtime, so the returned dict is shared and must not be modified."""
+        manifest_file = os.path.join(self._absolute_path, "__manifest__.py")
+        return _read_manifest(manifest_file, os.stat(manifest_file).st_mtime_ns)
+
+    @functools.cached_property
     def name(self) -> str:
         return self.path.stem
 
@@ -65,6 +87,7 @@ class godooModules:
             addon_paths = [addon_paths]
         self.addon_paths = addon_paths
         self.godoo_modules: Dict[str, godooModule] = {}
+        self._fully_scanned = False
 
     def get_modules(
         self, module_names: Optional[List[str]] = None, raise_missing_names=True
@@ -84,8 +107,11 @@ class godooModules:
 
     def _get_modules(self) -> Generator[godooModule, None, None]:
         """Generator that Iterates Addon Paths and yields all godooModules found in them."""
+        if self._fully_scanned:
+            yield from list(self.godoo_modules.values())
+            return
         for path in self.addon_paths:
-            for addon_folder_child in path.iterdir():
+            for addon_folder_child in _iter_module_dirs(path):
                 try:
                     mod = self.godoo_modules.get(addon_folder_child.name)
                     if not mod:
@@ -99,39 +125,74 @@ class godooModules:
                 except NotAValidModuleError:
                     # Silently skip dir, as it's not a Odoo Module
                     continue
+        self._fully_scanned = True
 
     def get_module(self, name: str) -> Optional[godooModule]:
-        """Get one Specific Module by Name. Returns None if"""
+        """Get one Specific Module by Name. Raises ModuleNotFoundError if it isn't in the addon paths.
+        Scans all addon paths once on the first miss. Later lookups are dict hits."""
         if mod := self.godoo_modules.get(name):
             return mod
-        for mod in self._get_modules():
-            if mod.name == name:
+        if not self._fully_scanned:
+            for _ in self._get_modules():
+                pass
+            if mod := self.godoo_modules.get(name):
                 return mod
         raise ModuleNotFoundError(
             f"Module '{name}' not found in Paths: {[str(s.absolute()) for s in self.addon_paths]}"
         )
 
-    def get_module_dependencies(
-        self, module: Union[godooModule, List[godooModule]], dont_follow: Optional[List[str]] = None
-    ) -> List[godooModule]:
-        """Get dependant modules of module(s). Recursively follows dependencies."""
+    def iter_module_dependencies(
+        self, module: Union[godooModule, Iterable[godooModule]], dont_follow: Optional[Iterable[str]] = None
+    ) -> Generator[godooModule, None, None]:
+        """Yield dependant modules of module(s). Follows dependencies breadth first, visiting each module once.
+        Stops reading manifests as soon as the consumer stops iterating."""
         if isinstance(module, godooModule):
             module = [module]
-        deps = []
-        for mod in module:
-            deps += mod.odoo_depends
-        deps = list(set(deps))
-
-        if dont_follow:
-            deps = [d for d in deps if d not in dont_follow]
-        if deps:
-            dont_follow = (dont_follow or []) + deps
-            dep_modules = list(self.get_modules(deps, raise_missing_names=False))
-            sub_dep_modules = []
-            for dep in dep_modules:
-                sub_dep_modules += self.get_module_dependencies(dep, dont_follow)
-            return list(set(dep_modules + sub_dep_modules))
-        return []
+        visited = set(dont_follow or [])
+        queue = deque(module)
+        while queue:
+            for dep_name in queue.popleft().odoo_depends:
+                if dep_name in visited:
+                    continue
+                visited.add(dep_name)
+                try:
+                    dep = self.get_module(dep_name)
+                except ModuleNotFoundError as e:
+                    LOGGER.debug(e.msg)
+                    continue
+                yield dep
+                queue.append(dep)
+
+    def get_module_dependencies(
+        self, module: Union[godooModule, Iterable[godooModule]], dont_follow: Optional[Iterable[str]] = None
+    ) -> List[godooModule]:
+        """Get dependant modules of module(s). Follows dependencies breadth first, visiting each module once."""
+        return list(self.iter_module_dependencies(module, dont_follow=dont_follow))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_module_registry(addon_paths: Tuple[Path, ...]) -> godooModules:
+    module_reg = godooModules(list(addon_paths))
+    list(module_reg.get_modules())
+    return module_reg
+
+
+def get_module_registry(addon_paths: List[Path]) -> godooModules:
+    """Get a fully scanned godooModules for addon_paths.
+    Cached per addon paths for the running process only, so every CLI invocation sees the current modules.
+    Call _cached_module_registry.cache_clear() after changing the addon folders.
+
+    Parameters
+    ----------
+    addon_paths : List[Path]
+        Addon Paths to scan for modules
+
+    Returns
+    -------
+    godooModules
+        Module Registry with all modules of addon_paths already found
+    """
+    return _cached_module_registry(tuple(addon_paths))
 
 
 def get_zip_addon_path(thirdparty_path: Path) -> Path:
@@ -139,12 +200,29 @@ def get_zip_addon_path(thirdparty_path: Path) -> Path:
     return thirdparty_path / "custom"
 
 
+def _iter_module_dirs(path: Path) -> Generator[Path, None, None]:
+    """Yield the visible folders directly below path. Uses one directory listing without stat-ing files.
+    Dot folders are skipped, like the .<name>.old.* leftovers of replaced .zip checkouts."""
+    with os.scandir(path) as entries:
+        dirs = [Path(entry.path) for entry in entries if not entry.name.startswith(".") and entry.is_dir()]
+    yield from dirs
+
+
+def _has_any_module(path: Path) -> bool:
+    """Check if any folder directly below path is an odoo module. Stops listing at the first one found."""
+    with os.scandir(path) as entries:
+        return any(entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__manifest__.py")) for entry in entries)
+
+
+@functools.lru_cache(maxsize=4)
 def get_addon_paths(
     odoo_main_repo: Path,
     workspace_addon_path: Path,
     thirdparty_addon_path: Path,
 ) -> List[Path]:
     """Get Odoo Addon Paths for odoo.conf.
+    Cached per arguments. Call get_addon_paths.cache_clear() after changing the addon folders.
+    The returned list is shared between callers and must not be modified.
 
     Parameters
     ----------
@@ -161,13 +239,11 @@ def get_addon_paths(
         List of valid addon Paths
     """
     odoo_addon_paths = [odoo_main_repo / "addons", odoo_main_repo / "odoo" / "addons"]
-    if godooModules(workspace_addon_path).get_modules():
+    if workspace_addon_path.is_dir() and _has_any_module(workspace_addon_path):
         odoo_addon_paths.append(workspace_addon_path)
     zip_addon_path = get_zip_addon_path(thirdparty_addon_path)
-    zip_addon_repos = [f for f in zip_addon_path.iterdir() if f.is_dir() and next(godooModules(f).get_modules(), None)]
+    zip_addon_repos = [f for f in _iter_module_dirs(zip_addon_path) if _has_any_module(f)]
     odoo_addon_paths += zip_addon_repos
-    git_thirdparty_addon_repos = [
-        p for p in thirdparty_addon_path.iterdir() if next(godooModules(p).get_modules(), None)
-    ]
+    git_thirdparty_addon_repos = [p for p in _iter_module_dirs(thirdparty_addon_path) if _has_any_module(p)]
     odoo_addon_paths += git_thirdparty_addon_repos
-    return list(set(odoo_addon_paths))
+    return list(dict.fromkeys(odoo_addon_paths))
@@ -5,7 +5,7 @@ from typing import List
 
 from git import Repo
 
-from .modules import godooModule, godooModules
+from .modules import NotAValidModuleError, godooModule, godooModules
 
 LOGGER = getLogger(__name__)
 
@@ -31,22 +31,25 @@ def get_changed_modules(
     addon_path = addon_path.absolute()
     repo = Repo(addon_path, search_parent_directories=True)
     git_root = Path(repo.git.rev_parse("--show-toplevel"))
-    changed_module_files = []  # All files that changed in the repo and are in addon_path
-    diff_lines = repo.git.diff("--name-status", diff_ref).split("\n")
+    # One diff for the whole addon path. The pathspec lets git skip everything outside of it.
+    diff_lines = repo.git.diff("--name-status", diff_ref, "--", str(addon_path)).splitlines()
+    changed_folders = {}  # Module folder names directly below addon_path, in diff order
     for change in diff_lines:
-        diff_path = git_root / change.split("\t")[1]
-        if addon_path in diff_path.parents:
-            changed_module_files.append(diff_path)
+        # Renames and copies list both the old and the new path
+        for changed_file in change.split("\t")[1:]:
+            try:
+                relative_parts = (git_root / changed_file).relative_to(addon_path).parts
+            except ValueError:
+                continue
+            if len(relative_parts) > 1:
+                changed_folders[relative_parts[0]] = None
 
     changed_modules = []
-    odoo_module_paths = {m.path.absolute(): m for m in godooModules(addon_path).get_modules()}
-    for f in changed_module_files:
-        for pf in f.parents:
-            if m := odoo_module_paths.get(pf.absolute()):
-                changed_modules.append(m)
-                break
-            if pf.absolute() == addon_path:
-                break
+    for folder in changed_folders:
+        try:
+            changed_modules.append(godooModule(addon_path / folder))
+        except NotAValidModuleError:
+            continue
     if changed_modules:
         LOGGER.debug(
             "Found Modules changed to branch '%s':\n %s",
@@ -61,12 +64,11 @@ def get_changed_modules_and_depends(diff_ref: str, addon_path: Path) -> List[god
     changed_modules = get_changed_modules(addon_path=addon_path, diff_ref=diff_ref)
     if not changed_modules:
         return []
-    change_modules_depends = []
-    changed_module_names = [p.name for p in changed_modules]
-    all_modules = godooModules(addon_path).get_modules()
-    for module in all_modules:
-        depends = module.odoo_depends
-        for depend in depends:
-            if depend in changed_module_names:
-                change_modules_depends.append(module)
-    return list(set(changed_modules + change_modules_depends))
+    changed_module_names = {p.name for p in changed_modules}
+    # Each manifest is read once, modules depending on several changed modules are only added once
+    change_modules_depends = [
+        module
+        for module in godooModules(addon_path).get_modules()
+        if not changed_module_names.isdisjoint(module.odoo_depends)
+    ]
+    return list(dict.fromkeys(changed_modules + change_modules_depends))
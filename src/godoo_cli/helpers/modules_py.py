@@ -28,7 +28,7 @@ def _install_py_reqs_for_modules(modules: List[godooModule], module_reg: godooMo
     if isinstance(modules, GeneratorType):
         modules = list(modules)
     all_modules = modules + module_reg.get_module_dependencies(modules)
-    all_modules = list(set(all_modules))
+    all_modules = list(dict.fromkeys(all_modules))
     for mod in all_modules:
         reqs += mod.py_depends
     if reqs:
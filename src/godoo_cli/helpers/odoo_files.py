@@ -1,4 +1,5 @@
 """Functions that operate on Odoos Source Code."""
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -24,6 +25,7 @@ class OdooVersion:
 
 def odoo_bin_get_version(odoo_main_repo_path: Path) -> OdooVersion:
     """Get Odoo Version by calling 'odoo-bin --version'
+    Cached per odoo-bin folder, as odoo-bin needs to import Odoo to answer.
 
     Parameters
     ----------
@@ -35,6 +37,11 @@ def odoo_bin_get_version(odoo_main_repo_path: Path) -> OdooVersion:
     OdooVersion
         odoo-bin --version output parsed into Dataclass
     """
+    return _odoo_bin_get_version(odoo_main_repo_path.absolute())
+
+
+@functools.lru_cache(maxsize=4)
+def _odoo_bin_get_version(odoo_main_repo_path: Path) -> OdooVersion:
     odoo_bin_path = odoo_main_repo_path / "odoo-bin"
     version_out = run_cmd(f"{odoo_bin_path.absolute()} --version", capture_output=True, text=True)
     vers_match = re.match(r"(?P<text>.*) (?P<major>\d{0,2})\.(?P<minor>\d)", version_out.stdout)
@@ -1,14 +1,19 @@
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from ruamel.yaml import YAML
+from ..git.git_url import get_git_url
 
-from ..git.git_url import GitUrl
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
 
 LOGGER = logging.getLogger(__name__)
 
+# Absolute manifest path -> (mtime_ns, loader, parsed yaml)
+_MANIFEST_YML_CACHE: Dict[str, Tuple[int, "YAML", Any]] = {}
+
 
 def remove_unused_folders(thirdparty_addon_path: Path, thirdparty_repos, keep_folders: List[Path]):
     """Remove folders that are not included in git_repos anymore
@@ -24,7 +29,7 @@ def remove_unused_folders(thirdparty_addon_path: Path, thirdparty_repos, keep_fo
     keep_folders_absolute = [p.absolute() for p in keep_folders]
     for prefix in thirdparty_repos:
         for repo in thirdparty_repos[prefix]:
-            repo_url = GitUrl(repo["url"])
+            repo_url = get_git_url(repo["url"])
             allowed_folders.append(f"{prefix}_{repo_url.name}")
     for folder in thirdparty_addon_path.iterdir():
         if not folder.is_dir() or folder.absolute() in keep_folders_absolute:
@@ -71,7 +76,7 @@ def yaml_add_compare_commit(repo_dict, compare_target: str):
     compare_target : str
         git ref to compare to
     """
-    git_url = GitUrl(repo_dict["url"])
+    git_url = get_git_url(repo_dict["url"])
     try:
         compare_url = git_url.get_compare_url(repo_dict["commit"], compare_target)
         repo_dict.yaml_add_eol_comment(compare_url, "commit")
@@ -98,7 +103,7 @@ def yaml_remove_compare_commit(repo_dict):
         del repo_dict.ca.items[target]
 
 
-def yaml_roundtrip_loader() -> YAML:
+def yaml_roundtrip_loader() -> "YAML":
     """Return Ruamel Roundtrip loader.
 
     Returns
@@ -106,7 +111,53 @@ def yaml_roundtrip_loader() -> YAML:
     YAML
         Yaml Loader
     """
+    from ruamel.yaml import YAML
+
     yaml = YAML()
     yaml.preserve_quotes = True
     yaml.indent(mapping=2, sequence=4, offset=2)
     return yaml
+
+
+def load_manifest_yml(manifest_file: Path) -> Tuple["YAML", Any]:
+    """Load godoo manifest yml with the roundtrip loader.
+    Cached per path and mtime, so several steps of one run share the parsed yaml.
+    The returned data is shared. Write modifications back with dump_manifest_yml.
+
+    Parameters
+    ----------
+    manifest_file : Path
+        Path to manifest yml
+
+    Returns
+    -------
+    Tuple[YAML, Any]
+        Yaml Loader and loaded yaml data
+    """
+    # abspath only joins with the cwd. resolve() would lstat every path component to follow symlinks.
+    path = os.path.abspath(manifest_file)
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _MANIFEST_YML_CACHE.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+    yaml = yaml_roundtrip_loader()
+    data = yaml.load(Path(path))
+    _MANIFEST_YML_CACHE[path] = (mtime_ns, yaml, data)
+    return yaml, data
+
+
+def dump_manifest_yml(yaml: "YAML", data: Any, manifest_file: Path):
+    """Write manifest yml and keep the cache of load_manifest_yml in sync with the file.
+
+    Parameters
+    ----------
+    yaml : YAML
+        Yaml Loader returned by load_manifest_yml
+    data : Any
+        yaml data to write
+    manifest_file : Path
+        Path to manifest yml
+    """
+    path = os.path.abspath(manifest_file)
+    yaml.dump(data, Path(path))
+    _MANIFEST_YML_CACHE[path] = (os.stat(path).st_mtime_ns, yaml, data)
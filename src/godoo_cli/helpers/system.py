@@ -1,13 +1,15 @@
 """Helper functions around the host system"""
 
 import datetime
-import json
+import importlib.metadata
 import logging
 import os
+import re
+import shlex
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Union
+from typing import BinaryIO, List, Union
 
 import click
 import requests
@@ -20,15 +22,16 @@ from rich.traceback import install as install_rich_traceback
 from . import cli as godoo_cli_helpers
 
 LOGGER = logging.getLogger(__name__)
+PKG_NAME_SEPARATOR_RE = re.compile(r"[-_.]+")
 
 
-def run_cmd(command: str, **kwargs) -> subprocess.CompletedProcess:
+def run_cmd(command: Union[str, List[str]], **kwargs) -> subprocess.CompletedProcess:
     """Runs command via subprocess.run
 
     Parameters
     ----------
-    command : str
-        Command string
+    command : Union[str, List[str]]
+        Command string, or argv list which gets executed without a shell
     **kwargs
         get passed down to Run
 
@@ -36,9 +39,11 @@ def run_cmd(command: str, **kwargs) -> subprocess.CompletedProcess:
     -------
     CompletedProcess
     """
-    LOGGER.debug("Running shell:\n%s", command)
-    if not kwargs.get("shell"):
-        kwargs["shell"] = True
+    if isinstance(command, str):
+        LOGGER.debug("Running shell:\n%s", command)
+        kwargs.setdefault("shell", True)
+    else:
+        LOGGER.debug("Running:\n%s", shlex.join(command))
     proc = subprocess.run(command, **kwargs)
     LOGGER.debug("Return Code: %s", proc.returncode)
     return proc
@@ -106,8 +111,8 @@ def set_logging(verbose: bool = False) -> None:
         )
 
 
-def download_file(url: str, save_path: Path, chunk_size: int = 128) -> None:
-    """Download file from URL.
+def download_file(url: str, save_path: Path, chunk_size: int = 1 << 16) -> None:
+    """Download file from URL. Streams the response to disk, so big files never sit in memory.
 
     Parameters
     ----------
@@ -116,13 +121,35 @@ def download_file(url: str, save_path: Path, chunk_size: int = 128) -> None:
     save_path : _type_
         Where to save the file
     chunk_size : int, optional
-        Chunk size to iterate over request, by default 128
+        Chunk size to iterate over request, by default 64KiB
     """
     LOGGER.debug("Downloading File: '%s' to '%s'", url, save_path)
-    r = requests.get(url, stream=True)
     with open(save_path, "wb") as fd:
+        download_fileobj(url, fd, chunk_size=chunk_size)
+
+
+def download_fileobj(url: str, fileobj: BinaryIO, chunk_size: int = 1 << 16) -> int:
+    """Stream URL contents into an open binary file object.
+
+    Parameters
+    ----------
+    url : str
+        url to get file from
+    fileobj : BinaryIO
+        writable binary file object
+    chunk_size : int, optional
+        Chunk size to iterate over request, by default 64KiB
+
+    Returns
+    -------
+    int
+        Number of bytes written
+    """
+    written = 0
+    with requests.get(url, stream=True) as r:
         for chunk in r.iter_content(chunk_size=chunk_size):
-            fd.write(chunk)
+            written += fileobj.write(chunk)
+    return written
 
 
 def file_or_folder_size_mb(path: Path) -> float:
@@ -182,6 +209,11 @@ def typer_ask_overwrite_path(paths: Union[List[Path], Path]) -> bool:
     return False
 
 
+def _normalize_pkg_name(name: str) -> str:
+    """Normalize a python package name like pip does (PEP 503), so PyYAML matches pyyaml."""
+    return PKG_NAME_SEPARATOR_RE.sub("-", name).lower()
+
+
 def pip_install(package_names: List[str]):
     """Ensure Pip Package is installed. But only when not already installed."""
 
@@ -192,15 +224,11 @@ def pip_install(package_names: List[str]):
     package_names = [odoo_wrong_pkg_names.get(p, p) for p in package_names]
 
     LOGGER.debug("Ensuring Pip Packages are installed:\n%s", package_names)
-    installed_packages = run_cmd(
-        f"{sys.executable} -m pip list --format json --disable-pip-version-check",
-        check=True,
-        shell=True,
-        stdout=subprocess.PIPE,
-    ).stdout.decode("utf-8")
-    installed_packages = json.loads(installed_packages)
-    installed_packages = [p.get("name") for p in installed_packages]
-    if missing_packages := [p for p in package_names if p not in installed_packages]:
+    # Read installed distributions in process instead of spawning pip list
+    installed_packages = {
+        _normalize_pkg_name(name) for dist in importlib.metadata.distributions() if (name := dist.metadata["Name"])
+    }
+    if missing_packages := [p for p in package_names if _normalize_pkg_name(p) not in installed_packages]:
         LOGGER.info("Installing Python requirements: %s", missing_packages)
         res = run_cmd(
             f"{sys.executable} -m pip install {' '.join(missing_packages)} --disable-pip-version-check", shell=True
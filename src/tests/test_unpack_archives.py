@@ -0,0 +1,31 @@
+import tempfile
+import zipfile
+from pathlib import Path
+
+from godoo_cli.commands.source_get import unpack_addon_archives
+
+
+def test_unpack_addon_archives():
+    """Test extracting single and multi module zips and skipping zips without modules"""
+    with tempfile.TemporaryDirectory() as td:
+        td = Path(td)
+        archive_folder = td / "zips"
+        archive_folder.mkdir()
+        with zipfile.ZipFile(archive_folder / "single.zip", "w") as zf:
+            zf.writestr("mod_a/__manifest__.py", "{}")
+            zf.writestr("mod_a/models/__init__.py", "")
+        with zipfile.ZipFile(archive_folder / "multi.zip", "w") as zf:
+            zf.writestr("repo/mod_b/__manifest__.py", "{}")
+            zf.writestr("repo/mod_c/__manifest__.py", "{}")
+            zf.writestr("repo/README.md", "")
+        with zipfile.ZipFile(archive_folder / "empty.zip", "w") as zf:
+            zf.writestr("docs/README.md", "")
+
+        target = td / "custom"
+        unpack_addon_archives(archive_folder, target)
+
+        assert (target / "single_mods" / "mod_a" / "models" / "__init__.py").exists()
+        assert (target / "multi" / "mod_b" / "__manifest__.py").exists()
+        assert (target / "multi" / "mod_c" / "__manifest__.py").exists()
+        assert not (target / "multi" / "README.md").exists()
+        assert not (target / "empty").exists()